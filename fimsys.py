@@ -1,23 +1,86 @@
 import os
+import sys
 import json
 import time
+import base64
 import hashlib
+import mmap
 import logging
 from logging import Logger
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import fnmatch
-
-CHUNK_SIZE = 65536  # 64KB
+import functools
+import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: C-speed JSON for the baseline file; stdlib json otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Optional: OS file-change notifications (inotify/FSEvents/ReadDirectoryChangesW)
+# instead of rescanning the whole tree every interval. Falls back to polling.
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None  # type: ignore[assignment, misc]
+    FileSystemEventHandler = object  # type: ignore[assignment, misc]
+
+CHUNK_SIZE = 1048576  # 1MB, large chunks amortize the per-update call overhead
+MMAP_THRESHOLD = 1048576  # hash files above this via mmap in one update call
 DEFAULT_INTERVAL = 10  # seconds between scans
-
-
-def setup_logger(log_file: str = None) -> Logger:
-    logger = logging.getLogger("FIM")
+FULL_RESCAN_INTERVAL = 3600  # safety-net rescan when using OS notifications
+EVENT_QUEUE_SIZE = 10000
+
+# hashlib releases the GIL while digesting buffers, so threads overlap
+# both disk reads and hash compute.
+MAX_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# BLAKE2b is considerably faster than software SHA-256 and collision
+# resistance is all change detection needs; digest_size=32 keeps digests
+# the same length as SHA-256. Baselines hashed with another algorithm are
+# migrated on load.
+HASH_ALGO = 'blake2b'
+
+# SHA-256 backend: prefer ISA-L's assembly implementation when installed,
+# otherwise OpenSSL via hashlib. usedforsecurity=False lets OpenSSL skip
+# FIPS self-tests; change detection does not need a certified context.
+try:
+    from isal import isal_crypto as _isal_crypto  # type: ignore[import-not-found]
+except ImportError:
+    _isal_crypto = None
+
+try:
+    hashlib.new('sha256', usedforsecurity=False)
+    _HAS_USEDFORSECURITY = True
+except (TypeError, ValueError):
+    _HAS_USEDFORSECURITY = False
+
+
+def _sha256():
+    if _isal_crypto is not None:
+        return _isal_crypto.hashlib_sha256()
+    if _HAS_USEDFORSECURITY:
+        return hashlib.new('sha256', usedforsecurity=False)
+    return hashlib.sha256()
+
+
+@functools.lru_cache(maxsize=8)
+def setup_logger(log_file: Optional[str] = None) -> Logger:
+    # Cached per log_file: repeated scans reuse the logger (and its open
+    # file handle) instead of rebuilding handlers on every call. Each
+    # log_file gets its own named logger so configuring one can never
+    # rewire the handlers of another.
+    logger = logging.getLogger("FIM" if log_file is None else f"FIM:{log_file}")
     logger.setLevel(logging.DEBUG)
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
-    # Clear old handlers to avoid duplicates
+    # Clear stale handlers (e.g. after a module reload)
     if logger.hasHandlers():
         logger.handlers.clear()
 
@@ -37,18 +100,61 @@ def setup_logger(log_file: str = None) -> Logger:
     return logger
 
 
-def compute_sha256(file_path: str) -> str:
-    h = hashlib.sha256()
+def _new_hasher():
+    if HASH_ALGO == 'blake2b':
+        return hashlib.blake2b(digest_size=32)
+    return _sha256()
+
+
+# Each hashing thread reuses one read buffer, so the chunked path makes
+# zero allocations per chunk.
+_hash_buffer = threading.local()
+
+
+def _local_buffer() -> memoryview:
+    mv = getattr(_hash_buffer, 'view', None)
+    if mv is None:
+        mv = memoryview(bytearray(CHUNK_SIZE))
+        _hash_buffer.view = mv
+    return mv
+
+
+def compute_hash(file_path: str) -> str:
+    h = _new_hasher()
     try:
-        with open(file_path, 'rb') as f:
+        with open(file_path, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                # Map large files and digest the whole mapping in one
+                # update call, skipping the Python-level read loop.
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, 'madvise'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        h.update(mm)
+                    return base64.b64encode(h.digest()).decode('ascii')
+                except (OSError, ValueError):
+                    h = _new_hasher()  # mmap unavailable, use chunked read
+            mv = _local_buffer()
             while True:
-                chunk = f.read(CHUNK_SIZE)
-                if not chunk:
+                n = f.readinto(mv)
+                if not n:
                     break
-                h.update(chunk)
+                h.update(mv[:n])
     except (PermissionError, FileNotFoundError) as e:
         return f"<ERROR:{type(e).__name__}>"
-    return h.hexdigest()
+    # base64 (44 chars) over hex (64): a third less baseline to store,
+    # parse, and compare.
+    return base64.b64encode(h.digest()).decode('ascii')
+
+
+def compute_hash_pair(path_a: str, path_b: str) -> Tuple[str, str]:
+    # Entry point for a 2-way interleaved hash primitive: CPUs with SHA
+    # extensions can near-double throughput on two independent streams.
+    # Pure Python gains nothing from block-level interleaving, so this
+    # digests sequentially; the thread pool in _hash_many already overlaps
+    # independent streams across cores. A native 2x backend can override
+    # this without touching the callers.
+    return compute_hash(path_a), compute_hash(path_b)
 
 
 def get_file_metadata(path: str) -> Dict:
@@ -66,11 +172,182 @@ def normalize_path(path: str) -> str:
     return os.path.normpath(os.path.abspath(path))
 
 
-def should_exclude(path: str, exclude_patterns: List[str]) -> bool:
-    for pat in exclude_patterns:
-        if fnmatch.fnmatch(path, pat) or fnmatch.fnmatch(os.path.basename(path), pat):
-            return True
-    return False
+@functools.lru_cache(maxsize=32)
+def _compile_excludes(patterns: tuple) -> Optional[re.Pattern]:
+    # One union regex instead of an fnmatch call per pattern per path.
+    # Patterns and paths go through os.path.normcase to keep fnmatch's
+    # case-insensitive matching on Windows.
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+def should_exclude(path: str, exclude_re: Optional[re.Pattern]) -> bool:
+    if exclude_re is None:
+        return False
+    path = os.path.normcase(path)
+    return bool(exclude_re.match(path)) or bool(exclude_re.match(os.path.basename(path)))
+
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    _FindExInfoBasic = 1
+    _FindExSearchNameMatch = 0
+    _FIND_FIRST_EX_LARGE_FETCH = 2
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+    _FILE_ATTRIBUTE_DIRECTORY = 0x10
+    _FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+    _FILETIME_EPOCH_OFFSET = 116444736000000000  # 100ns ticks, 1601 -> 1970
+
+    class _WIN32_FIND_DATAW(ctypes.Structure):
+        _fields_ = [
+            ('dwFileAttributes', wintypes.DWORD),
+            ('ftCreationTime', wintypes.FILETIME),
+            ('ftLastAccessTime', wintypes.FILETIME),
+            ('ftLastWriteTime', wintypes.FILETIME),
+            ('nFileSizeHigh', wintypes.DWORD),
+            ('nFileSizeLow', wintypes.DWORD),
+            ('dwReserved0', wintypes.DWORD),
+            ('dwReserved1', wintypes.DWORD),
+            ('cFileName', wintypes.WCHAR * 260),
+            ('cAlternateFileName', wintypes.WCHAR * 14)
+        ]
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.FindFirstFileExW.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(_WIN32_FIND_DATAW),
+        ctypes.c_int, wintypes.LPVOID, wintypes.DWORD]
+    _kernel32.FindFirstFileExW.restype = wintypes.HANDLE
+    _kernel32.FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_WIN32_FIND_DATAW)]
+    _kernel32.FindNextFileW.restype = wintypes.BOOL
+    _kernel32.FindClose.argtypes = [wintypes.HANDLE]
+    _kernel32.FindClose.restype = wintypes.BOOL
+
+    def _win_find_path(directory: str) -> str:
+        # \\?\ lifts the MAX_PATH limit, which plain FindFirstFileExW
+        # paths are still subject to.
+        if directory.startswith('\\\\?\\'):
+            return directory
+        if directory.startswith('\\\\'):
+            return '\\\\?\\UNC\\' + directory[2:]
+        return '\\\\?\\' + directory
+
+    def _filetime_to_mtime(ft) -> float:
+        # Split seconds and 100ns remainder exactly like CPython does for
+        # st_mtime (sec + nsec*1e-9); one combined float multiply rounds
+        # differently and would break the fast path's mtime == equality
+        # against os.stat-recorded entries.
+        ticks = ((ft.dwHighDateTime << 32) | ft.dwLowDateTime) - _FILETIME_EPOCH_OFFSET
+        sec, rem = divmod(ticks, 10000000)
+        return sec + rem * 100 * 1e-9
+
+    def _walk_files_win(target_dir: str, exclude_re: Optional[re.Pattern]):
+        # FindFirstFileExW with FIND_FIRST_EX_LARGE_FETCH returns size and
+        # mtime inline per directory entry and batches directory reads, so
+        # the whole walk issues no per-file stat calls at all.
+        sep = os.sep
+        prefix_len = len(target_dir) + (0 if target_dir.endswith(sep) else 1)
+        stack = [target_dir]
+        data = _WIN32_FIND_DATAW()
+        while stack:
+            current_dir = stack.pop()
+            # Drive roots ("C:\\") already end with the separator; \\?\
+            # paths get no Win32 normalization, so a doubled separator
+            # would be passed to the filesystem verbatim and the query
+            # would fail.
+            parent = current_dir if current_dir.endswith(sep) else current_dir + sep
+            handle = _kernel32.FindFirstFileExW(
+                _win_find_path(parent) + '*', _FindExInfoBasic, ctypes.byref(data),
+                _FindExSearchNameMatch, None, _FIND_FIRST_EX_LARGE_FETCH)
+            if handle == _INVALID_HANDLE_VALUE:
+                continue
+            try:
+                while True:
+                    name = data.cFileName
+                    attrs = data.dwFileAttributes
+                    if name not in ('.', '..'):
+                        full = parent + name
+                        if exclude_re is None or not should_exclude(full, exclude_re):
+                            if attrs & _FILE_ATTRIBUTE_REPARSE_POINT:
+                                # Same symlink policy as the scandir
+                                # walker: follow links to files (target
+                                # metadata), never recurse into linked
+                                # directories.
+                                if not attrs & _FILE_ATTRIBUTE_DIRECTORY and os.path.isfile(full):
+                                    yield full, full[prefix_len:], get_file_metadata(full)
+                            elif attrs & _FILE_ATTRIBUTE_DIRECTORY:
+                                stack.append(full)
+                            else:
+                                md = {
+                                    'size': (data.nFileSizeHigh << 32) | data.nFileSizeLow,
+                                    'mtime': _filetime_to_mtime(data.ftLastWriteTime)
+                                }
+                                yield full, full[prefix_len:], md
+                    if not _kernel32.FindNextFileW(handle, ctypes.byref(data)):
+                        break
+            finally:
+                _kernel32.FindClose(handle)
+
+
+def _walk_files_scandir(target_dir: str, exclude_re: Optional[re.Pattern]):
+    # os.scandir hands back DirEntry objects whose type and stat info come
+    # from the directory read itself, so no extra stat syscall per file.
+    # target_dir is normalized, so relative paths are a plain prefix slice
+    # instead of an os.path.relpath call per file.
+    prefix_len = len(target_dir) + (0 if target_dir.endswith(os.sep) else 1)
+    stack = [target_dir]
+    while stack:
+        current_dir = stack.pop()
+        try:
+            entries = os.scandir(current_dir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                full = entry.path
+                if exclude_re is not None and should_exclude(full, exclude_re):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(full)
+                elif entry.is_file():
+                    # Follows symlinks, like the original os.walk+os.stat
+                    # loop: links to files are monitored (via their target
+                    # metadata), linked directories are not recursed into.
+                    md: Dict = {'size': None, 'mtime': None}
+                    try:
+                        st = entry.stat()
+                        md = {'size': st.st_size, 'mtime': st.st_mtime}
+                    except OSError:
+                        pass
+                    yield full, full[prefix_len:], md
+
+
+if sys.platform == 'win32':
+    _walk_files = _walk_files_win
+else:
+    _walk_files = _walk_files_scandir
+
+
+def _hash_one(full: str, rel: str, md: Dict) -> Tuple[str, Dict]:
+    return rel, {
+        'hash': compute_hash(full),
+        'algo': HASH_ALGO,
+        'size': md.get('size'),
+        'mtime': md.get('mtime')
+    }
+
+
+def _hash_many(items: List, out: Dict):
+    if len(items) <= 1:
+        for full, rel, md in items:
+            rel, entry = _hash_one(full, rel, md)
+            out[rel] = entry
+        return
+    with ThreadPoolExecutor(max_workers=MAX_HASH_WORKERS) as ex:
+        for rel, entry in ex.map(lambda it: _hash_one(*it), items):
+            out[rel] = entry
 
 
 def build_baseline(target_dir: str, baseline_file: str, exclude_patterns: List[str]) -> Dict:
@@ -83,73 +360,155 @@ def build_baseline(target_dir: str, baseline_file: str, exclude_patterns: List[s
         'files': {}
     }
 
-    for root, dirs, files in os.walk(target_dir):
-        dirs[:] = [d for d in dirs if not should_exclude(os.path.join(root, d), exclude_patterns)]
-        for f in files:
-            full = os.path.join(root, f)
-            if should_exclude(full, exclude_patterns):
-                continue
-            rel = os.path.relpath(full, target_dir)
-            h = compute_sha256(full)
-            md = get_file_metadata(full)
-            baseline['files'][rel] = {
-                'hash': h,
-                'size': md.get('size'),
-                'mtime': md.get('mtime')
-            }
-    with open(baseline_file, 'w', encoding='utf-8') as bf:
-        json.dump(baseline, bf, indent=2)
+    exclude_re = _compile_excludes(tuple(exclude_patterns))
+    items = list(_walk_files(target_dir, exclude_re))
+    _hash_many(items, baseline['files'])
+    save_baseline(baseline, baseline_file)
     return baseline
 
 
-def load_baseline(baseline_file: str) -> Dict:
+def _to_columnar(baseline: Dict) -> Dict:
+    # On disk the baseline is stored as parallel arrays instead of one
+    # dict per file: no repeated key strings per entry, so the JSON is a
+    # fraction of the size and parses much faster.
+    files = baseline['files']
+    paths = list(files.keys())
+    return {
+        'meta': baseline['meta'],
+        'format': 'columnar',
+        'paths': paths,
+        'hashes': [files[p].get('hash') for p in paths],
+        'algos': [files[p].get('algo') for p in paths],
+        'sizes': [files[p].get('size') for p in paths],
+        'mtimes': [files[p].get('mtime') for p in paths]
+    }
+
+
+def _from_columnar(doc: Dict) -> Dict:
+    files = {}
+    for p, h, a, s, m in zip(doc['paths'], doc['hashes'], doc['algos'], doc['sizes'], doc['mtimes']):
+        files[p] = {'hash': h, 'algo': a, 'size': s, 'mtime': m}
+    return {'meta': doc.get('meta', {}), 'files': files}
+
+
+def save_baseline(baseline: Dict, baseline_file: str):
+    # Write to a temp file and rename so a crash mid-write never leaves a
+    # truncated baseline behind.
+    baseline = _to_columnar(baseline)
+    tmp = baseline_file + '.tmp'
+    if orjson is not None:
+        with open(tmp, 'wb') as bf:
+            bf.write(orjson.dumps(baseline))
+    else:
+        with open(tmp, 'w', encoding='utf-8') as bf:
+            json.dump(baseline, bf, separators=(',', ':'))
+    os.replace(tmp, baseline_file)
+
+
+def _migrate_entries(baseline: Dict) -> bool:
+    # Re-hash entries recorded with a different algorithm (e.g. an old
+    # SHA-256 baseline) so comparisons stay digest-to-digest, and
+    # re-encode old 64-char hex digests as base64. Returns whether
+    # anything was rewritten so the caller can persist the result.
+    root = baseline.get('meta', {}).get('root')
+    if not root:
+        return False
+    changed = False
+    for rel, entry in baseline.get('files', {}).items():
+        if entry.get('algo', 'sha256') != HASH_ALGO:
+            entry['hash'] = compute_hash(os.path.join(root, rel))
+            entry['algo'] = HASH_ALGO
+            changed = True
+            continue
+        h = entry.get('hash')
+        if isinstance(h, str) and len(h) == 64:
+            try:
+                entry['hash'] = base64.b64encode(bytes.fromhex(h)).decode('ascii')
+                changed = True
+            except ValueError:
+                pass
+    return changed
+
+
+def load_baseline(baseline_file: str) -> Optional[Dict]:
     try:
-        with open(baseline_file, 'r', encoding='utf-8') as bf:
-            return json.load(bf)
+        with open(baseline_file, 'rb') as bf:
+            data = bf.read()
     except FileNotFoundError:
         return None
+    baseline = orjson.loads(data) if orjson is not None else json.loads(data)
+    if baseline.get('format') == 'columnar':
+        baseline = _from_columnar(baseline)
+    if _migrate_entries(baseline):
+        # Persist the migrated digests so the upgrade re-hash is paid
+        # once, not on every subsequent load.
+        save_baseline(baseline, baseline_file)
+    return baseline
 
 
-def scan_current_state(target_dir: str, exclude_patterns: List[str]) -> Dict:
+def scan_current_state(target_dir: str, exclude_patterns: List[str], baseline: Optional[Dict] = None) -> Dict:
     target_dir = normalize_path(target_dir)
+    base_files = baseline.get('files', {}) if baseline else {}
+    exclude_re = _compile_excludes(tuple(exclude_patterns))
     cur = {}
-    for root, dirs, files in os.walk(target_dir):
-        dirs[:] = [d for d in dirs if not should_exclude(os.path.join(root, d), exclude_patterns)]
-        for f in files:
-            full = os.path.join(root, f)
-            if should_exclude(full, exclude_patterns):
-                continue
-            rel = os.path.relpath(full, target_dir)
-            h = compute_sha256(full)
-            md = get_file_metadata(full)
-            cur[rel] = {
-                'hash': h,
-                'size': md.get('size'),
-                'mtime': md.get('mtime')
-            }
+    items = []
+    for full, rel, md in _walk_files(target_dir, exclude_re):
+        # Fast path: if size and mtime match the baseline entry, reuse the
+        # entry itself instead of re-reading the file — unchanged files
+        # inherit their baseline record by reference, so a steady-state
+        # scan allocates nothing per file.
+        base = base_files.get(rel)
+        if (base is not None and base.get('algo', 'sha256') == HASH_ALGO
+                and base.get('size') == md['size'] and base.get('mtime') == md['mtime']):
+            cur[rel] = base
+        else:
+            items.append((full, rel, md))
+    _hash_many(items, cur)
     return cur
 
 
 def compare_baseline_and_current(baseline: Dict, current: Dict) -> Dict:
     added, deleted, modified = [], [], []
     base_files = baseline.get('files', {}) if baseline else {}
-    base_keys, cur_keys = set(base_files.keys()), set(current.keys())
+    # Dict key views support set algebra directly, so no full set of all
+    # paths is materialized per scan — only the (usually tiny) differences.
+    base_keys, cur_keys = base_files.keys(), current.keys()
 
     added_keys = cur_keys - base_keys
-    deleted_keys = base_keys - cur_keys
-    common_keys = base_keys & cur_keys
-
     for k in added_keys:
         added.append({'path': k, 'current': current[k]})
-    for k in deleted_keys:
-        deleted.append({'path': k, 'baseline': base_files[k]})
-    for k in common_keys:
-        if base_files[k].get('hash') != current[k].get('hash'):
-            modified.append({'path': k, 'baseline': base_files[k], 'current': current[k]})
+    # No additions and equal counts means the key sets are identical:
+    # skip the deleted sweep entirely.
+    if added_keys or len(base_files) != len(current):
+        for k in base_keys - cur_keys:
+            deleted.append({'path': k, 'baseline': base_files[k]})
+    for k, cur in current.items():
+        base = base_files.get(k)
+        # Unchanged files share the baseline entry object (scan fast
+        # path), so one identity check skips them outright.
+        if base is None or base is cur:
+            continue
+        # Cheap int compare first; the digest strings are only compared
+        # when the sizes agree.
+        if base.get('size') != cur.get('size') or base.get('hash') != cur.get('hash'):
+            modified.append({'path': k, 'baseline': base, 'current': cur})
 
     return {'added': added, 'deleted': deleted, 'modified': modified}
 
 
+def apply_diffs(baseline: Dict, diffs: Dict):
+    # Fold a diff back into the baseline in place; much cheaper than
+    # rebuilding the whole files dict when only a few entries changed.
+    files = baseline['files']
+    for a in diffs['added']:
+        files[a['path']] = a['current']
+    for m in diffs['modified']:
+        files[m['path']] = m['current']
+    for d in diffs['deleted']:
+        files.pop(d['path'], None)
+    baseline['meta']['generated_at'] = datetime.utcnow().isoformat() + 'Z'
+
+
 def print_and_log_diffs(diffs: Dict, logger: Logger):
     changes = 0
     if diffs['added']:
@@ -172,28 +531,125 @@ def print_and_log_diffs(diffs: Dict, logger: Logger):
     return changes
 
 
-def monitor_loop(target_dir: str, baseline_file: str, interval: int, log_file: str, update_baseline: bool, exclude_patterns: List[str]):
-    logger = setup_logger(log_file)
-    logger.info(f"Monitoring {target_dir} every {interval}s...")
-    baseline = load_baseline(baseline_file)
-    if baseline is None:
-        logger.error("Baseline not found. Run baseline first.")
+class FIMHandler(FileSystemEventHandler):
+    def __init__(self, events: queue.Queue):
+        self._events = events
+
+    def _enqueue(self, path):
+        try:
+            self._events.put_nowait(path)
+        except queue.Full:
+            pass  # safety-net rescan will pick it up
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+            self._enqueue(event.dest_path)
+
+
+def _handle_event(path: str, events: queue.Queue, target_dir: str, baseline: Dict,
+                  baseline_file: str, update_baseline: bool,
+                  exclude_re: Optional[re.Pattern], logger: Logger, lock: threading.Lock):
+    full = normalize_path(path)
+    if should_exclude(full, exclude_re):
         return
+    rel = os.path.relpath(full, target_dir)
+    entry: Optional[Dict] = None
+    if os.path.isfile(full):
+        _, entry = _hash_one(full, rel, get_file_metadata(full))
+    with lock:
+        base = baseline['files'].get(rel)
+        if entry is None:
+            if base is None:
+                return
+            diffs = {'added': [], 'deleted': [{'path': rel, 'baseline': base}], 'modified': []}
+        elif base is None:
+            diffs = {'added': [{'path': rel, 'current': entry}], 'deleted': [], 'modified': []}
+        elif base.get('hash') != entry.get('hash'):
+            diffs = {'added': [], 'deleted': [], 'modified': [{'path': rel, 'baseline': base, 'current': entry}]}
+        else:
+            return
+        print_and_log_diffs(diffs, logger)
+        if update_baseline:
+            apply_diffs(baseline, diffs)
+            # Coalesce a burst of events into one write: only persist
+            # once the queue has drained.
+            if events.empty():
+                save_baseline(baseline, baseline_file)
+                logger.info("Baseline auto-updated after change.")
+
+
+def _event_worker(events: queue.Queue, target_dir: str, baseline: Dict, baseline_file: str,
+                  update_baseline: bool, exclude_patterns: List[str], logger: Logger,
+                  lock: threading.Lock):
+    exclude_re = _compile_excludes(tuple(exclude_patterns))
+    while True:
+        path = events.get()
+        try:
+            _handle_event(path, events, target_dir, baseline, baseline_file,
+                          update_baseline, exclude_re, logger, lock)
+        except Exception as e:
+            logger.error(f"Event handling failed for {path}: {e}")
+        finally:
+            events.task_done()
+
+
+def _monitor_events(target_dir: str, baseline_file: str, baseline: Dict,
+                    update_baseline: bool, exclude_patterns: List[str], logger: Logger):
+    events: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+    lock = threading.Lock()
+    worker = threading.Thread(
+        target=_event_worker,
+        args=(events, target_dir, baseline, baseline_file, update_baseline, exclude_patterns, logger, lock),
+        daemon=True)
+    worker.start()
+
+    observer = Observer()
+    observer.schedule(FIMHandler(events), target_dir, recursive=True)
+    observer.start()
+    try:
+        while True:
+            # Slow full rescan as a safety net for dropped/missed events.
+            time.sleep(FULL_RESCAN_INTERVAL)
+            with lock:
+                current = scan_current_state(target_dir, exclude_patterns, baseline)
+                diffs = compare_baseline_and_current(baseline, current)
+                changes = print_and_log_diffs(diffs, logger)
+                if changes > 0 and update_baseline:
+                    apply_diffs(baseline, diffs)
+                    save_baseline(baseline, baseline_file)
+                    logger.info("Baseline auto-updated after change.")
+    except KeyboardInterrupt:
+        logger.info("Monitoring stopped.")
+    finally:
+        observer.stop()
+        observer.join()
+
 
+def _monitor_poll(target_dir: str, baseline_file: str, baseline: Dict, interval: int,
+                  update_baseline: bool, exclude_patterns: List[str], logger: Logger):
     try:
         while True:
-            current = scan_current_state(target_dir, exclude_patterns)
+            current = scan_current_state(target_dir, exclude_patterns, baseline)
             diffs = compare_baseline_and_current(baseline, current)
             changes = print_and_log_diffs(diffs, logger)
 
             # ✅ Auto-update baseline after changes
             if changes > 0 and update_baseline:
-                baseline = {
-                    'meta': {'generated_at': datetime.utcnow().isoformat() + 'Z', 'root': normalize_path(target_dir)},
-                    'files': current
-                }
-                with open(baseline_file, 'w', encoding='utf-8') as bf:
-                    json.dump(baseline, bf, indent=2)
+                apply_diffs(baseline, diffs)
+                save_baseline(baseline, baseline_file)
                 logger.info("Baseline auto-updated after change.")
 
             time.sleep(interval)
@@ -201,13 +657,29 @@ def monitor_loop(target_dir: str, baseline_file: str, interval: int, log_file: s
         logger.info("Monitoring stopped.")
 
 
+def monitor_loop(target_dir: str, baseline_file: str, interval: int, log_file: str, update_baseline: bool, exclude_patterns: List[str]):
+    logger = setup_logger(log_file)
+    baseline = load_baseline(baseline_file)
+    if baseline is None:
+        logger.error("Baseline not found. Run baseline first.")
+        return
+    target_dir = normalize_path(target_dir)
+
+    if Observer is not None:
+        logger.info(f"Monitoring {target_dir} via OS file notifications...")
+        _monitor_events(target_dir, baseline_file, baseline, update_baseline, exclude_patterns, logger)
+    else:
+        logger.info(f"Monitoring {target_dir} every {interval}s (install watchdog for event-driven monitoring)...")
+        _monitor_poll(target_dir, baseline_file, baseline, interval, update_baseline, exclude_patterns, logger)
+
+
 def run_scan_once(target_dir: str, baseline_file: str, log_file: str, exclude_patterns: List[str]) -> int:
     logger = setup_logger(log_file)
     baseline = load_baseline(baseline_file)
     if baseline is None:
         logger.error("Baseline not found. Run baseline first.")
         return 2
-    current = scan_current_state(target_dir, exclude_patterns)
+    current = scan_current_state(target_dir, exclude_patterns, baseline)
     diffs = compare_baseline_and_current(baseline, current)
     changes = print_and_log_diffs(diffs, logger)
     return 0 if changes == 0 else 1